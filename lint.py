@@ -1,24 +1,42 @@
 #!/usr/bin/env python
 
+import asyncio
 import subprocess
 import sys
 
 PROJECT_DIR = 'src/'
 
 
-def main():
+async def _run(cmd: tuple[str, ...]) -> tuple[int, bytes, bytes]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+
+    assert proc.returncode is not None
+
+    return proc.returncode, stdout, stderr
+
+
+async def main():
     commands = [
         (sys.executable, '-m', 'flake8', PROJECT_DIR),
         (sys.executable, '-m', 'mypy', '--config-file', 'pyproject.toml', PROJECT_DIR),
         (sys.executable, '-m', 'isort', '--check', PROJECT_DIR),
     ]
 
-    procs = [(subprocess.Popen(cmd), cmd) for cmd in commands]
+    results = await asyncio.gather(*(_run(cmd) for cmd in commands))
 
     failed = []
 
-    for proc, cmd in procs:
-        status = proc.wait()
+    # print every command's output as one block, so that they do not interleave
+    for cmd, (status, stdout, stderr) in zip(commands, results):
+        sys.stdout.buffer.write(stdout)
+        sys.stdout.flush()
+        sys.stderr.buffer.write(stderr)
+        sys.stderr.flush()
 
         if status != 0:
             failed.append((status, cmd))
@@ -32,4 +50,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -1,26 +1,34 @@
 import abc
 import asyncio
+import collections
 import dataclasses
 import datetime
 import enum
-import http
-import itertools
-import json
-import urllib.request
-from typing import Coroutine, Iterable, Self, cast, override
+import functools
+import gzip
+import hashlib
+import hmac
+import http.client
+import operator
+import ssl
+import sys
+import time
+from typing import AsyncIterator, Callable, Iterable, Self, override
 
 import boto3
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
+import orjson
+from botocore.credentials import ReadOnlyCredentials, RefreshableCredentials
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Description:
     title: str
     blocks: Iterable[str] = tuple()
 
 
 class Expiriable(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractproperty
     def id(self) -> str: ...
 
@@ -39,24 +47,64 @@ class Expiriable(abc.ABC):
     @abc.abstractmethod
     def valid_until(self) -> datetime.datetime: ...
 
+    @abc.abstractmethod
+    def valid_until_timestamp(self) -> int:
+        """
+        `valid_until` as whole unix seconds, for cheap comparisons
+        """
+
     @abc.abstractmethod
     def describe(self) -> Description: ...
 
 
 class FromDictMixin:
+    __slots__ = ()
+
     @classmethod
-    def from_dict(cls, dct: dict) -> Self:
+    @functools.cache
+    def _init_field_names(cls) -> tuple[str, ...]:
         if not dataclasses.is_dataclass(cls):
             raise TypeError(f'{cls.__name__} is not a dataclass')
 
+        return tuple(field.name for field in dataclasses.fields(cls) if field.init)
+
+    @classmethod
+    @functools.cache
+    def _field_names(cls) -> frozenset[str]:
+        return frozenset(cls._init_field_names())
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> Self:
         # unsure no extra fields in dct
-        fields = {field.name for field in dataclasses.fields(cls)}
-        data = {k: v for k, v in dct.items() if k in fields}
+        fields = cls._field_names()
 
-        return cls(**data)
+        return cls(**{k: v for k, v in dct.items() if k in fields})
 
+    @classmethod
+    @functools.cache
+    def _fields_getter(cls) -> Callable[[dict], tuple]:
+        names = cls._init_field_names()
+        getter = operator.itemgetter(*names)
+
+        if len(names) == 1:
+            return lambda dct: (getter(dct), )
+
+        return getter
+
+    @classmethod
+    def from_dict_fast(cls, dct: dict) -> Self:
+        """
+        construct positionally, falls back to `from_dict` when a field is missing
+        """
+        try:
+            values = cls._fields_getter()(dct)
+        except KeyError:
+            return cls.from_dict(dct)
 
-@dataclasses.dataclass
+        return cls(*values)
+
+
+@dataclasses.dataclass(slots=True)
 class ReservedCapacity(FromDictMixin, Expiriable):
     DurationSeconds: int
     FixedPrice: float
@@ -67,6 +115,27 @@ class ReservedCapacity(FromDictMixin, Expiriable):
     UsagePrice: float
     UsageType: str
 
+    # parsed once in __post_init__
+    _start_date: datetime.datetime = dataclasses.field(
+        init=False, repr=False, compare=False)
+    _valid_until: datetime.datetime = dataclasses.field(
+        init=False, repr=False, compare=False)
+    _valid_until_timestamp: int = dataclasses.field(init=False, repr=False, compare=False)
+    _is_active: bool = dataclasses.field(init=False, repr=False, compare=False)
+    # built lazily by describe()
+    _description: Description | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        unix_timestamp = int(self.StartDate) / 1000
+
+        self._start_date = datetime.datetime.fromtimestamp(
+            unix_timestamp, datetime.timezone.utc)
+        self._valid_until = self._start_date + datetime.timedelta(
+            seconds=int(self.DurationSeconds))
+        self._valid_until_timestamp = int(self._valid_until.timestamp())
+        self._is_active = self.ReservedCapacityState == 'active'
+
     @override
     def get_link(self, region: str = 'us-east-1') -> str:
         return f'https://{region}.console.aws.amazon.com/dynamodbv2/home?region={region}#reserved-capacity'  # noqa: E501
@@ -81,22 +150,27 @@ class ReservedCapacity(FromDictMixin, Expiriable):
 
     @override
     def is_active(self) -> bool:
-        return self.ReservedCapacityState == 'active'
+        return self._is_active
 
     @override
     def valid_until(self) -> datetime.datetime:
-        valid_delta = datetime.timedelta(seconds=int(self.DurationSeconds))
+        return self._valid_until
 
-        return self.start_date() + valid_delta
+    @override
+    def valid_until_timestamp(self) -> int:
+        return self._valid_until_timestamp
 
     @override
     def describe(self) -> Description:
+        if self._description is not None:
+            return self._description
+
         days_remaining = (
             self.valid_until() - datetime.datetime.now(datetime.timezone.utc)
         ).days
         start_date = self.start_date().strftime('%Y-%m-%d')
 
-        return Description(
+        self._description = Description(
             title=f'DynamoDB Reserved Capacity for ${self.upfront_cost():.2f}',
             blocks=(
                 f'ID: `{self.id}`',
@@ -104,17 +178,17 @@ class ReservedCapacity(FromDictMixin, Expiriable):
             )
         )
 
+        return self._description
+
     @override
     def start_date(self) -> datetime.datetime:
-        unix_timestamp = int(self.StartDate) / 1000
-
-        return datetime.datetime.fromtimestamp(unix_timestamp, datetime.timezone.utc)
+        return self._start_date
 
     def upfront_cost(self):
         return self.FixedPrice * self.InstanceCount
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SavingsPlan(FromDictMixin, Expiriable):
     commitment: str
     description: str
@@ -127,6 +201,23 @@ class SavingsPlan(FromDictMixin, Expiriable):
     state: str
     tags: dict[str, str]
 
+    # parsed once in __post_init__
+    _start_date: datetime.datetime = dataclasses.field(
+        init=False, repr=False, compare=False)
+    _valid_until: datetime.datetime = dataclasses.field(
+        init=False, repr=False, compare=False)
+    _valid_until_timestamp: int = dataclasses.field(init=False, repr=False, compare=False)
+    _is_active: bool = dataclasses.field(init=False, repr=False, compare=False)
+    # built lazily by describe()
+    _description: Description | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._start_date = datetime.datetime.fromisoformat(self.start)
+        self._valid_until = datetime.datetime.fromisoformat(self.end)
+        self._valid_until_timestamp = int(self._valid_until.timestamp())
+        self._is_active = self.state == 'active'
+
     @override
     def get_link(self, region: str = 'us-east-1') -> str:
         return f'https://{region}.console.aws.amazon.com/costmanagement/home#/savings-plans/inventory'  # noqa: E501
@@ -141,14 +232,21 @@ class SavingsPlan(FromDictMixin, Expiriable):
 
     @override
     def is_active(self) -> bool:
-        return self.state == 'active'
+        return self._is_active
 
     @override
     def valid_until(self) -> datetime.datetime:
-        return datetime.datetime.fromisoformat(self.end)
+        return self._valid_until
+
+    @override
+    def valid_until_timestamp(self) -> int:
+        return self._valid_until_timestamp
 
     @override
     def describe(self) -> Description:
+        if self._description is not None:
+            return self._description
+
         days_remaining = (
             self.valid_until() - datetime.datetime.now(datetime.timezone.utc)
         ).days
@@ -156,7 +254,7 @@ class SavingsPlan(FromDictMixin, Expiriable):
         start_date = self.start_date().strftime('%Y-%m-%d')
         tags_as_str = ', '.join(f'`{k}={v}`' for k, v in self.tags.items())
 
-        return Description(
+        self._description = Description(
             title=f'{self.description} for ${float(self.commitment):.2f}',
             blocks=(
                 f'ID: `{self.id}`',
@@ -165,54 +263,230 @@ class SavingsPlan(FromDictMixin, Expiriable):
             )
         )
 
+        return self._description
+
     @override
     def start_date(self) -> datetime.datetime:
-        return datetime.datetime.fromisoformat(self.start)
+        return self._start_date
 
 
-async def _make_custom_request(
-        session: boto3.Session,
-        region: str,
-        service: str,
-        rpc_target: str,
-        method: str = 'POST',
-        body: dict = {}) -> dict | None:
-    credentials = session.get_credentials()
-    assert credentials is not None
+class _ConnectionPool:
+    """
+    Minimal async HTTPS client, that keeps idle connections around, so that
+    consecutive requests to the same host reuse the TCP + TLS session.
+    """
 
-    frozen_credentials = credentials.get_frozen_credentials()
+    def __init__(self, limit: int = 32, timeout: float = 30):
+        self._ssl_context = ssl.create_default_context()
+        self._timeout = timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self._idle: dict[str, list[http.client.HTTPSConnection]] = (
+            collections.defaultdict(list))
 
-    url = f'https://{service}.{region}.amazonaws.com/'
-    headers = {
-        'Host': f'{service}.{region}.amazonaws.com',
-        'Content-Type': 'application/x-amz-json-1.0',
-        'X-Amz-Target': rpc_target,
-    }
-    body_encoded = json.dumps(body).encode()
+    def _acquire(self, host: str) -> tuple[http.client.HTTPSConnection, bool]:
+        """
+        returns the connection and whether it was reused from the pool
+        """
+        idle = self._idle[host]
+        if len(idle) > 0:
+            return idle.pop(), True
 
-    aws_request = AWSRequest(method=method, url=url,
-                             data=body_encoded, headers=headers)
+        connection = http.client.HTTPSConnection(
+            host, timeout=self._timeout, context=self._ssl_context)
 
-    SigV4Auth(frozen_credentials, service_name=service,
-              region_name=region).add_auth(aws_request)
+        return connection, False
 
-    prepared_headers = dict(aws_request.headers.items())
+    async def request(
+        self,
+        host: str,
+        method: str,
+        body: bytes,
+        headers: dict[str, str],
+    ) -> tuple[int, bytes]:
+        def _do_fetch(connection: http.client.HTTPSConnection) -> tuple[int, bytes]:
+            connection.request(method, '/', body=body, headers=headers)
+            res = connection.getresponse()
+
+            # the whole body has to be consumed before the connection can be reused
+            data = res.read()
+            if res.getheader('Content-Encoding') == 'gzip':
+                data = gzip.decompress(data)
+
+            return res.status, data
+
+        async with self._semaphore:
+            connection, reused = self._acquire(host)
+            try:
+                try:
+                    response = await asyncio.to_thread(_do_fetch, connection)
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    if not reused:
+                        raise
+
+                    # the server has closed the idle connection in the meantime
+                    connection.close()
+                    response = await asyncio.to_thread(_do_fetch, connection)
+            except BaseException:
+                connection.close()
+                raise
+
+            self._idle[host].append(connection)
+
+        return response
+
+    def close(self):
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+
+        self._idle.clear()
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+# Accept-Encoding is part of the template, so that it gets signed as well
+_RPC_HEADERS = {
+    'accept-encoding': 'gzip',
+    'content-type': 'application/x-amz-json-1.0',
+}
+
+
+class _RpcSigner:
+    """
+    SigV4 signer specialized for the JSON RPC endpoints - the path is always `/`,
+    there is no query string and the set of signed headers is fixed, so the
+    canonical header layout is computed once. The signing key is derived only
+    once per (day, region, service, credentials).
+    """
+
+    _ALGORITHM = 'AWS4-HMAC-SHA256'
+    _MAX_CACHED_KEYS = 16
+    _signing_keys: collections.OrderedDict[tuple[str, ...], bytes] = (
+        collections.OrderedDict())
+
+    def __init__(self, service: str, region: str):
+        self._service = service
+        self._region = region
+        self.host = f'{service}.{region}.amazonaws.com'
+
+        self._static_headers = {**_RPC_HEADERS, 'host': self.host}
+
+        # indexed by whether a session token is signed as well
+        header_names = sorted((*self._static_headers, 'x-amz-date', 'x-amz-target'))
+        self._header_order = (
+            tuple(header_names),
+            tuple(sorted((*header_names, 'x-amz-security-token'))),
+        )
+        self._signed_headers = tuple(';'.join(names) for names in self._header_order)
+
+    def _signing_key(self, credentials: ReadOnlyCredentials, datestamp: str) -> bytes:
+        secret_key = credentials.secret_key
+        access_key = credentials.access_key
+        assert secret_key is not None and access_key is not None
+
+        cache_key = (
+            datestamp,
+            self._region,
+            self._service,
+            access_key,
+            hashlib.sha256(secret_key.encode()).hexdigest()[:16],
+        )
 
-    request = urllib.request.Request(
-        method=method,
-        url=url,
-        data=body_encoded,
-        headers=prepared_headers,
-    )
+        signing_key = self._signing_keys.get(cache_key)
+        if signing_key is not None:
+            self._signing_keys.move_to_end(cache_key)
 
-    def _do_fetch(req: urllib.request.Request):
-        res: http.client.HTTPResponse
-        with urllib.request.urlopen(req) as res:
-            assert res.status >= 200 and res.status < 300, res.read().decode()
+            return signing_key
 
-            return json.loads(res.read().decode())
+        k_date = _hmac_sha256(f'AWS4{secret_key}'.encode(), datestamp)
+        k_region = _hmac_sha256(k_date, self._region)
+        k_service = _hmac_sha256(k_region, self._service)
+        signing_key = _hmac_sha256(k_service, 'aws4_request')
 
-    return await asyncio.to_thread(_do_fetch, request)
+        self._signing_keys[cache_key] = signing_key
+        if len(self._signing_keys) > self._MAX_CACHED_KEYS:
+            self._signing_keys.popitem(last=False)
+
+        return signing_key
+
+    def sign(
+        self,
+        credentials: ReadOnlyCredentials,
+        method: str,
+        rpc_target: str,
+        body: bytes,
+    ) -> dict[str, str]:
+        """
+        returns the complete set of request headers, including `authorization`
+        """
+        amz_date = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+        datestamp = amz_date[:8]
+
+        headers = {
+            **self._static_headers,
+            'x-amz-date': amz_date,
+            'x-amz-target': rpc_target,
+        }
+
+        token = credentials.token
+        with_token = token is not None
+        if token is not None:
+            headers['x-amz-security-token'] = token
+
+        canonical_headers = ''.join(
+            f'{name}:{headers[name]}\n' for name in self._header_order[with_token])
+        signed_headers = self._signed_headers[with_token]
+
+        canonical_request = '\n'.join((
+            method,
+            '/',
+            '',
+            canonical_headers,
+            signed_headers,
+            hashlib.sha256(body).hexdigest(),
+        ))
+
+        scope = f'{datestamp}/{self._region}/{self._service}/aws4_request'
+        string_to_sign = '\n'.join((
+            self._ALGORITHM,
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ))
+
+        signature = hmac.new(
+            self._signing_key(credentials, datestamp),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        headers['authorization'] = (
+            f'{self._ALGORITHM} Credential={credentials.access_key}/{scope}, '
+            f'SignedHeaders={signed_headers}, Signature={signature}'
+        )
+
+        return headers
+
+
+async def _make_custom_request(
+        credentials: ReadOnlyCredentials,
+        pool: _ConnectionPool,
+        signer: _RpcSigner,
+        rpc_target: str,
+        method: str = 'POST',
+        body: bytes = b'{}') -> dict | None:
+    """
+    `body` is the already JSON encoded request payload
+    """
+    headers = signer.sign(credentials, method, rpc_target, body)
+
+    status, data = await pool.request(signer.host, method, body, headers)
+    if not (200 <= status < 300):
+        raise RuntimeError(f'{rpc_target} failed with {status}: {data.decode()}')
+
+    return orjson.loads(data)
 
 
 class SupportedResource(enum.StrEnum):
@@ -220,95 +494,180 @@ class SupportedResource(enum.StrEnum):
     COMPUTE_SAVINGS_PLAN = enum.auto()
 
     @classmethod
-    def all(cls) -> Iterable['SupportedResource']:
-        return (r for r in cls)
+    def all(cls) -> tuple['SupportedResource', ...]:
+        return _ALL_SUPPORTED_RESOURCES
+
+
+_ALL_SUPPORTED_RESOURCES = tuple(SupportedResource)
 
 
 class SavingsRepository:
-    _RPC_RESERVED_CAPACITY = 'ReservedCapacity_20120810.DescribeReservedCapacity'
+    __slots__ = (
+        '_session',
+        '_credentials',
+        '_frozen_credentials',
+        '_pool',
+        '_dynamodb_signer',
+        '_ignored_uuids',
+    )
+
+    _RPC_RESERVED_CAPACITY = sys.intern('ReservedCapacity_20120810.DescribeReservedCapacity')
+    # how many reserved capacity pages to request ahead of the one being parsed
+    _RESERVED_CAPACITY_PAGES_AHEAD = 4
 
     def __init__(self, session: boto3.Session):
         self._session = session
+        self._credentials = session.get_credentials()
+        self._frozen_credentials: ReadOnlyCredentials | None = None
+        self._pool = _ConnectionPool()
+        self._dynamodb_signer = _RpcSigner('dynamodb', session.region_name)
         self._ignored_uuids: set[str] = set()
 
-    async def _list_dynamodb_reserved_capacities(self) -> list[ReservedCapacity]:
-        objects: list[ReservedCapacity] = []
-        pager = 0
-
-        while True:
-            response = await _make_custom_request(
-                self._session,
-                self._session.region_name,
-                'dynamodb',
-                self._RPC_RESERVED_CAPACITY,
-                body={'ExclusiveStartKey': str(pager)},
-            )
-
-            assert response is not None
-
-            objects.extend(ReservedCapacity.from_dict(json_capacity)
-                           for json_capacity in response.get('ReservedCapacities', []))
-
-            next_pager = int(response.get('LastEvaluatedKey', '-1'))
-            if next_pager - pager > len(response.get('ReservedCapacities', [])):
-                break
-            else:
-                pager = next_pager
-
-        return objects
-
-    async def _list_savings_plans(self) -> list[SavingsPlan]:
-        max_results = 1000
-        objects: list[SavingsPlan] = []
-        pager = None
-        client = self._session.client(
-            'savingsplans', region_name=self._session.region_name)
+    def _get_frozen_credentials(self) -> ReadOnlyCredentials:
+        if self._frozen_credentials is not None:
+            return self._frozen_credentials
 
-        while True:
-            params = {'maxResults': max_results}
-            if pager is not None:
-                params['nextToken'] = pager
+        assert self._credentials is not None
+        frozen_credentials = self._credentials.get_frozen_credentials()
 
-            response = await asyncio.to_thread(client.describe_savings_plans, **params)
+        # refreshable credentials (STS, SSO, instance profile, ...) refresh
+        # themselves when about to expire, only static ones are kept
+        if not isinstance(self._credentials, RefreshableCredentials):
+            self._frozen_credentials = frozen_credentials
 
-            savings_plans = response['savingsPlans']
-            if len(savings_plans) == 0:
-                break
+        return frozen_credentials
 
-            objects.extend(SavingsPlan.from_dict(sp) for sp in savings_plans)
-
-            if len(savings_plans) >= max_results and 'nextToken' in response:
-                pager = response['nextToken']
-            else:
-                break
+    def _request_reserved_capacities_page(
+        self,
+        start_key: int,
+    ) -> asyncio.Task[dict | None]:
+        return asyncio.create_task(_make_custom_request(
+            self._get_frozen_credentials(),
+            self._pool,
+            self._dynamodb_signer,
+            self._RPC_RESERVED_CAPACITY,
+            # fixed shape, so there is no need to run it through a JSON encoder
+            body=b'{"ExclusiveStartKey":"%d"}' % start_key,
+        ))
 
-        return objects
+    async def _iter_dynamodb_reserved_capacities(
+        self,
+    ) -> AsyncIterator[list[ReservedCapacity]]:
+        ignored = self._ignored_uuids
+        # (start key, request) of the pages in flight, in page order
+        in_flight: collections.deque[tuple[int, asyncio.Task[dict | None]]] = (
+            collections.deque())
+        in_flight.append((0, self._request_reserved_capacities_page(0)))
+
+        try:
+            while len(in_flight) > 0:
+                pager, page_task = in_flight.popleft()
+                response = await page_task
+
+                assert response is not None
+
+                json_capacities = response.get('ReservedCapacities', [])
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                next_pager = int(last_evaluated_key) if last_evaluated_key is not None else -1
+                # a missing key would otherwise restart the listing from -1 forever
+                is_last_page = (last_evaluated_key is None
+                                or next_pager - pager > len(json_capacities))
+
+                # the speculatively requested pages are past the end or misaligned
+                if is_last_page or (len(in_flight) > 0 and in_flight[0][0] != next_pager):
+                    for _, task in in_flight:
+                        task.cancel()
+
+                    in_flight.clear()
+
+                # start keys are contiguous, so once the page stride is known,
+                # keep a window of the following pages in flight
+                if not is_last_page:
+                    stride = next_pager - pager
+                    window = self._RESERVED_CAPACITY_PAGES_AHEAD if stride > 0 else 1
+                    start_key = in_flight[-1][0] + stride if len(in_flight) > 0 else next_pager
+
+                    while len(in_flight) < window:
+                        in_flight.append(
+                            (start_key, self._request_reserved_capacities_page(start_key)))
+                        start_key += stride
+
+                yield [ReservedCapacity.from_dict_fast(json_capacity)
+                       for json_capacity in json_capacities
+                       if json_capacity.get('ReservedCapacityId') not in ignored]
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+
+    async def _iter_savings_plans(self) -> AsyncIterator[list[SavingsPlan]]:
+        ignored = self._ignored_uuids
+        session = self._session
+
+        def _fetch_all() -> list[SavingsPlan]:
+            # every page depends on the previous one's token, so the whole
+            # listing runs in one worker thread instead of one hop per page
+            max_results = 1000
+            objects: list[SavingsPlan] = []
+            pager = None
+            client = session.client('savingsplans', region_name=session.region_name)
+
+            while True:
+                # only active plans are ever notified about, see `SavingsPlan.is_active`
+                params: dict = {'maxResults': max_results, 'states': ['active']}
+                if pager is not None:
+                    params['nextToken'] = pager
+
+                response = client.describe_savings_plans(**params)
+
+                savings_plans = response['savingsPlans']
+                if len(savings_plans) == 0:
+                    break
+
+                objects.extend(SavingsPlan.from_dict_fast(sp) for sp in savings_plans
+                               if sp.get('savingsPlanId') not in ignored)
+
+                if len(savings_plans) >= max_results and 'nextToken' in response:
+                    pager = response['nextToken']
+                else:
+                    break
+
+            return objects
+
+        yield await asyncio.to_thread(_fetch_all)
 
     async def collect_resources(
         self,
         resources_to_fetch: Iterable[SupportedResource],
     ) -> list[Expiriable]:
-        resource_futures: list[Coroutine] = []
+        page_iterators: list[AsyncIterator[Iterable[Expiriable]]] = []
 
         for resource_descr in resources_to_fetch:
             match resource_descr:
                 case SupportedResource.COMPUTE_SAVINGS_PLAN:
-                    resource_futures.append(
-                        cast(Coroutine, self._list_savings_plans()))
+                    page_iterators.append(self._iter_savings_plans())
 
                 case SupportedResource.DYNAMODB_RESERVED_CAPACITY:
-                    resource_futures.append(
-                        cast(Coroutine, self._list_dynamodb_reserved_capacities()))
+                    page_iterators.append(self._iter_dynamodb_reserved_capacities())
 
-        resources: Iterable[Expiriable] = itertools.chain.from_iterable(
-            await asyncio.gather(*resource_futures),
-        )
+        async def _collect_pages(
+            pages: AsyncIterator[Iterable[Expiriable]],
+        ) -> list[Expiriable]:
+            objects: list[Expiriable] = []
+            async for page in pages:
+                objects.extend(page)
+
+            return objects
+
+        # every resource type is paged through concurrently,
+        # ignored resources are already dropped while parsing the pages
+        results = await asyncio.gather(
+            *(_collect_pages(pages) for pages in page_iterators))
 
         # collect eagerly - so not to return an async generator
-        return list(filter(
-            lambda r: r.id not in self._ignored_uuids,
-            resources,
-        ))
+        return [r for resources in results for r in resources]
 
     def ignore_uuids(self, ignored_uuids: Iterable[str]):
         self._ignored_uuids.update(ignored_uuids)
+
+    def close(self):
+        self._pool.close()
@@ -0,0 +1,145 @@
+import asyncio
+import datetime
+import time
+import unittest
+from unittest import mock
+
+import boto3
+import orjson
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import ReadOnlyCredentials
+
+from . import aws
+from .aws import _RPC_HEADERS, SavingsRepository, _RpcSigner
+
+_FROZEN_NOW = datetime.datetime(2024, 5, 17, 12, 30, 45)
+
+
+class RpcSignerTestCase(unittest.TestCase):
+    def _assert_matches_botocore(self, credentials: ReadOnlyCredentials):
+        region = 'eu-central-1'
+        rpc_target = 'ReservedCapacity_20120810.DescribeReservedCapacity'
+        body = b'{"ExclusiveStartKey":"0"}'
+        signer = _RpcSigner('dynamodb', region)
+
+        with (mock.patch('time.gmtime', return_value=_FROZEN_NOW.timetuple()),
+              mock.patch('botocore.auth.get_current_datetime', return_value=_FROZEN_NOW)):
+            headers = signer.sign(credentials, 'POST', rpc_target, body)
+
+            request = AWSRequest(
+                method='POST',
+                url=f'https://{signer.host}/',
+                data=body,
+                headers={**_RPC_HEADERS, 'x-amz-target': rpc_target},
+            )
+            SigV4Auth(credentials, 'dynamodb', region).add_auth(request)
+
+        self.assertEqual(headers['x-amz-date'], request.headers['X-Amz-Date'])
+        self.assertEqual(headers['authorization'], request.headers['Authorization'])
+
+        return headers, request
+
+    def test_matches_botocore_without_token(self):
+        headers, _ = self._assert_matches_botocore(ReadOnlyCredentials(
+            'AKIDEXAMPLE', 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY', None))
+
+        self.assertNotIn('x-amz-security-token', headers)
+
+    def test_matches_botocore_with_token(self):
+        headers, request = self._assert_matches_botocore(ReadOnlyCredentials(
+            'ASIAEXAMPLE', 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY', 'session-token'))
+
+        self.assertEqual(
+            headers['x-amz-security-token'], request.headers['X-Amz-Security-Token'])
+
+
+def _reserved_capacities(start: int, stop: int) -> list[dict]:
+    return [
+        {
+            'DurationSeconds': 86400 * 30,
+            'FixedPrice': 1.0,
+            'InstanceCount': 1,
+            'ReservedCapacityId': f'rc-{i}',
+            'ReservedCapacityState': 'active',
+            'StartDate': str(int(time.time() * 1000)),
+            'UsagePrice': 0.0,
+            'UsageType': 'test',
+        }
+        for i in range(start, stop)
+    ]
+
+
+class ReservedCapacityPagingTestCase(unittest.IsolatedAsyncioTestCase):
+    async def _list_ids(self, pages: dict[int, dict]) -> list[str]:
+        """
+        `pages` are the responses by `ExclusiveStartKey`, any other
+        start key gets an empty response without `LastEvaluatedKey`
+        """
+        self.requested_keys: list[int] = []
+
+        async def _fake_request(*args, body: bytes, **kwargs) -> dict:
+            start_key = int(orjson.loads(body)['ExclusiveStartKey'])
+            self.requested_keys.append(start_key)
+            # let the speculative requests actually overlap
+            await asyncio.sleep(0)
+
+            return pages.get(start_key, {'ReservedCapacities': []})
+
+        repository = SavingsRepository(boto3.Session(
+            aws_access_key_id='AKIDEXAMPLE',
+            aws_secret_access_key='secret',
+            region_name='eu-central-1',
+        ))
+
+        try:
+            with mock.patch.object(aws, '_make_custom_request', _fake_request):
+                resources = await repository.collect_resources(
+                    [aws.SupportedResource.DYNAMODB_RESERVED_CAPACITY])
+        finally:
+            repository.close()
+
+        return [resource.id for resource in resources]
+
+    async def test_empty_listing(self):
+        ids = await self._list_ids({0: {'ReservedCapacities': []}})
+
+        self.assertEqual(ids, [])
+        self.assertEqual(self.requested_keys, [0])
+
+    async def test_single_partial_page(self):
+        ids = await self._list_ids({
+            0: {'ReservedCapacities': _reserved_capacities(0, 3), 'LastEvaluatedKey': '100'},
+        })
+
+        self.assertEqual(ids, ['rc-0', 'rc-1', 'rc-2'])
+        self.assertEqual(self.requested_keys, [0])
+
+    async def test_exact_multiple_of_page_size(self):
+        ids = await self._list_ids({
+            0: {'ReservedCapacities': _reserved_capacities(0, 2), 'LastEvaluatedKey': '2'},
+            2: {'ReservedCapacities': _reserved_capacities(2, 4), 'LastEvaluatedKey': '4'},
+            4: {'ReservedCapacities': [], 'LastEvaluatedKey': '100'},
+        })
+
+        self.assertEqual(ids, ['rc-0', 'rc-1', 'rc-2', 'rc-3'])
+
+    async def test_missing_last_evaluated_key(self):
+        ids = await self._list_ids({
+            0: {'ReservedCapacities': _reserved_capacities(0, 2), 'LastEvaluatedKey': '2'},
+            2: {'ReservedCapacities': _reserved_capacities(2, 4)},
+        })
+
+        self.assertEqual(ids, ['rc-0', 'rc-1', 'rc-2', 'rc-3'])
+
+    async def test_misaligned_key(self):
+        # the second page is longer than the first one,
+        # so the pages requested ahead from key 4 on are thrown away
+        ids = await self._list_ids({
+            0: {'ReservedCapacities': _reserved_capacities(0, 2), 'LastEvaluatedKey': '2'},
+            2: {'ReservedCapacities': _reserved_capacities(2, 5), 'LastEvaluatedKey': '5'},
+            5: {'ReservedCapacities': _reserved_capacities(5, 6)},
+        })
+
+        self.assertEqual(ids, [f'rc-{i}' for i in range(6)])
+        self.assertIn(5, self.requested_keys)
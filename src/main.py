@@ -1,6 +1,10 @@
 import asyncio
+import contextlib
 import dataclasses
+import functools
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import slack_sdk
@@ -9,8 +13,14 @@ from crawlee.storages import KeyValueStore
 
 from .aws import Expiriable, SavingsRepository, SupportedResource
 from .notifications import (Notification, cleanup_kv_store,
-                            create_notification_text, get_expiring_soon,
-                            mark_resources_as_notified)
+                            create_notification_text,
+                            mark_resources_as_notified,
+                            partition_expiring_soon)
+
+_SLACK_MAX_BLOCKS = 50
+
+# at most one post per notification type, kept off the default executor
+_slack_executor = ThreadPoolExecutor(max_workers=len(Notification))
 
 
 @dataclasses.dataclass
@@ -46,9 +56,10 @@ async def handle_slack_notification(
     channel_name: str,
     default_owner: str | None,
 ) -> None:
-    text = await create_notification_text(
+    text, blocks = await create_notification_text(
         notification=notification_type,
         slack=client,
+        store=store,
         resources=resources,
         default_owner=default_owner,
     )
@@ -58,10 +69,14 @@ async def handle_slack_notification(
 
         return
 
-    await asyncio.to_thread(
-        client.chat_postMessage,
-        channel=channel_name,
-        markdown_text=text,
+    # Slack rejects messages with too many blocks, post those as one markdown text
+    message: dict = {'markdown_text': text}
+    if len(blocks) <= _SLACK_MAX_BLOCKS:
+        message = {'text': text, 'blocks': blocks}
+
+    await asyncio.get_running_loop().run_in_executor(
+        _slack_executor,
+        functools.partial(client.chat_postMessage, channel=channel_name, **message),
     )
     await mark_resources_as_notified(notification_type, store, resources)
 
@@ -77,86 +92,78 @@ async def main() -> None:
 
         savings_repo.ignore_uuids(input.ignored_uuids)
 
-        savings_resources: list[Expiriable] = list(await savings_repo.collect_resources(
-            (input.target_resource, ),
-        ))
+        with contextlib.closing(savings_repo):
+            savings_resources: list[Expiriable] = list(await savings_repo.collect_resources(
+                (input.target_resource, ),
+            ))
         if len(savings_resources) <= 0:
             Actor.log.info('no notifications to be send, skipping')
             return
 
-        notification_futures = []
+        # soonest to expire first - in the notifications as well
+        savings_resources.sort(key=lambda r: r.valid_until_timestamp())
 
-        # ==================== LONG NOTIFICATION
-        long_reminder_delta = Notification.REMINDER_LONG.notify_delta(
-            input.__dict__,
+        long_notified: list[str]
+        short_notified: list[str]
+        long_notified, short_notified = await asyncio.gather(
+            store.get_value(Notification.REMINDER_LONG.store_key, []),
+            store.get_value(Notification.REMINDER_SHORT.store_key, []),
         )
-        long_notified_ids: set[str] = set(await store.get_value(Notification.REMINDER_LONG.store_key, []))  # noqa: E501
-        Actor.log.info(
-            f'ignoring sending notifications',
-            extra={
-                'ids': long_notified_ids,
-                'store_name': input.store_name,
-                'store_keys': await store.list_keys(),
+        long_notified_ids: set[str] = set(long_notified)
+        short_notified_ids: set[str] = set(short_notified)
+        if Actor.log.isEnabledFor(logging.DEBUG):
+            Actor.log.debug(
+                'ignoring sending notifications',
+                extra={
+                    'long_ids': long_notified_ids,
+                    'short_ids': short_notified_ids,
+                    'store_name': input.store_name,
+                    'store_keys': await store.list_keys(),
+                },
+            )
+
+        # a single pass over the resources fills all three notification rounds
+        to_notify = partition_expiring_soon(
+            savings_resources,
+            notify_periods={
+                notification_type: notification_type.notify_delta(input.__dict__)
+                for notification_type in (
+                    Notification.REMINDER_LONG,
+                    Notification.REMINDER_SHORT,
+                    Notification.URGENT,
+                )
             },
-        )
-        to_notify_long = list(get_expiring_soon(
-            savings_resources, long_reminder_delta, ignore_ids=long_notified_ids))
-
-        if len(to_notify_long) > 0:
-            notification_futures.append(handle_slack_notification(
-                Notification.REMINDER_LONG,
-                resources=to_notify_long,
-                store=store,
-                client=slack,
-                channel_name=input.slack_channel_id,
-                default_owner=input.default_owner,
-            ))
-        # ====================
-
-        # ==================== SHORT NOTIFICATION
-        short_reminder_delta = Notification.REMINDER_SHORT.notify_delta(
-            input.__dict__,
-        )
-        short_notified_ids: set[str] = set(await store.get_value(Notification.REMINDER_SHORT.store_key, []))  # noqa: E501
-        Actor.log.info(
-            f'ignoring sending notifications',
-            extra={
-                'ids': long_notified_ids,
-                'store_name': input.store_name,
-                'store_keys': await store.list_keys(),
+            ignore_ids={
+                Notification.REMINDER_LONG: long_notified_ids,
+                Notification.REMINDER_SHORT: short_notified_ids,
             },
+            assume_sorted=True,
         )
-        to_notify_short = list(get_expiring_soon(
-            savings_resources, short_reminder_delta, ignore_ids=short_notified_ids))
-
-        if len(to_notify_short) > 0:
-            notification_futures.append(handle_slack_notification(
-                Notification.REMINDER_SHORT,
-                resources=to_notify_short,
-                store=store,
-                client=slack,
-                channel_name=input.slack_channel_id,
-                default_owner=input.default_owner,
-            ))
 
-        # ==================== URGENT NOTIFICATION
-        urgent_reminder_delta = Notification.URGENT.notify_delta(
-            input.__dict__,
+        # a failed post must not cancel the others, a message that was posted
+        # but not marked as sent would be posted again on the next run
+        results = await asyncio.gather(
+            *(
+                handle_slack_notification(
+                    notification_type,
+                    resources=resources,
+                    store=store,
+                    client=slack,
+                    channel_name=input.slack_channel_id,
+                    default_owner=input.default_owner,
+                )
+                for notification_type, resources in to_notify.items()
+                if len(resources) > 0
+            ),
+            return_exceptions=True,
         )
-        to_notify_urgently = list(get_expiring_soon(
-            savings_resources, urgent_reminder_delta))
-
-        if len(to_notify_urgently) > 0:
-            notification_futures.append(handle_slack_notification(
-                Notification.URGENT,
-                resources=to_notify_urgently,
-                store=store,
-                client=slack,
-                channel_name=input.slack_channel_id,
-                default_owner=input.default_owner,
-            ))
-        # ====================
-
-        await asyncio.gather(*notification_futures)
-        await cleanup_kv_store(Notification.REMINDER_LONG, store, savings_resources)
-        await cleanup_kv_store(Notification.REMINDER_SHORT, store, savings_resources)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # only once every notification has been marked as sent
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(cleanup_kv_store(
+                Notification.REMINDER_LONG, store, savings_resources))
+            tg.create_task(cleanup_kv_store(
+                Notification.REMINDER_SHORT, store, savings_resources))
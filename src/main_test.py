@@ -4,7 +4,8 @@ import unittest
 from typing import cast
 
 from .aws import ReservedCapacity
-from .notifications import get_expiring_soon
+from .notifications import (Notification, get_expiring_soon,
+                            partition_expiring_soon)
 
 
 def _create_test_reserved_capacity(id: str, expire_date: datetime.datetime):
@@ -45,3 +46,66 @@ class ExpiringTimingTestCase(unittest.TestCase):
 
         self.assertEqual(len(expiring_soon), 1)
         self.assertEqual(expiring_soon[0].ReservedCapacityId, '1')
+
+
+class PartitionExpiringTestCase(unittest.TestCase):
+    def test_matches_get_expiring_soon(self):
+        now = datetime.datetime.now()
+        resources = [
+            _create_test_reserved_capacity(str(days), now + datetime.timedelta(days=days))
+            for days in (1, 5, 10, 20, 40)
+        ]
+        notify_periods = {
+            Notification.REMINDER_LONG: datetime.timedelta(days=30),
+            Notification.REMINDER_SHORT: datetime.timedelta(days=14),
+            Notification.URGENT: datetime.timedelta(days=3),
+        }
+        ignore_ids = {Notification.REMINDER_SHORT: {'5'}}
+
+        partitioned = partition_expiring_soon(resources, notify_periods, ignore_ids)
+
+        for notification, period in notify_periods.items():
+            expected = list(get_expiring_soon(
+                resources, period, ignore_ids=ignore_ids.get(notification, set())))
+
+            self.assertEqual(partitioned[notification], expected)
+
+        self.assertEqual(
+            [r.id for r in partitioned[Notification.REMINDER_SHORT]], ['1', '10'])
+
+    def test_skips_ids_ignored_in_every_window(self):
+        now = datetime.datetime.now()
+        resources = [
+            _create_test_reserved_capacity(str(days), now + datetime.timedelta(days=days))
+            for days in (1, 5)
+        ]
+        notify_periods = {
+            Notification.REMINDER_SHORT: datetime.timedelta(days=14),
+            Notification.URGENT: datetime.timedelta(days=3),
+        }
+        ignore_ids = {
+            Notification.REMINDER_SHORT: {'1', '5'},
+            Notification.URGENT: {'1'},
+        }
+
+        partitioned = partition_expiring_soon(resources, notify_periods, ignore_ids)
+
+        self.assertEqual(partitioned, {
+            Notification.REMINDER_SHORT: [],
+            Notification.URGENT: [],
+        })
+
+    def test_sorted_scan_stops_past_the_windows(self):
+        now = datetime.datetime.now()
+        resources = [
+            _create_test_reserved_capacity(str(days), now + datetime.timedelta(days=days))
+            for days in (1, 5, 40)
+        ]
+        # out of order, must not be reached when the input is declared sorted
+        resources.append(_create_test_reserved_capacity('late', now + datetime.timedelta(days=2)))
+        notify_periods = {Notification.REMINDER_SHORT: datetime.timedelta(days=14)}
+
+        partitioned = partition_expiring_soon(resources, notify_periods, assume_sorted=True)
+
+        self.assertEqual(
+            [r.id for r in partitioned[Notification.REMINDER_SHORT]], ['1', '5'])
@@ -1,7 +1,10 @@
 import asyncio
 import datetime
 import enum
-from typing import Generator, Iterable
+import functools
+import operator
+import time
+from typing import AbstractSet, Generator, Iterable, Mapping
 
 import slack_sdk
 from crawlee.storages import KeyValueStore
@@ -9,20 +12,33 @@ from crawlee.storages import KeyValueStore
 from .aws import Expiriable
 
 _SENT_NOTIFICATIONS_KEY = 'notifications-sent'
+_SLACK_USERS_CACHE_KEY = 'slack-users-cache'
+_SLACK_USERS_CACHE_TTL = datetime.timedelta(minutes=10)
 
 
 def acache(async_func):
     """
     ignores parameters!!!
+
+    concurrent callers share a single in-flight call, a failed call is retried
+    by the next caller
     """
-    previous_value = None
+    task: asyncio.Task | None = None
 
     async def _decorated(*args, **kwargs):
-        nonlocal previous_value
-        if previous_value is None:
-            previous_value = await async_func(*args, **kwargs)
+        nonlocal task
+        if task is None:
+            task = asyncio.ensure_future(async_func(*args, **kwargs))
+
+        current = task
+        try:
+            # a cancelled caller must not cancel the call for the others
+            return await asyncio.shield(current)
+        except BaseException:
+            if task is current and current.done():
+                task = None
 
-        return previous_value
+            raise
 
     return _decorated
 
@@ -31,22 +47,17 @@ def _format_resource_row(
     resource: Expiriable,
     owner_slack_id: str | None,
 ) -> str:
-    indent = ''
-    text = ''
+    indent = 4*' '
 
     description = resource.describe()
-    text += f'{indent}- {description.title}'
-    text += f' ([link]({resource.get_link()}))'
+    parts = [f'- {description.title}', f' ([link]({resource.get_link()}))']
     if owner_slack_id is not None:
-        text += f' <@{owner_slack_id}>'
+        parts.append(f' <@{owner_slack_id}>')
 
-    text += '\n'
-    indent = 4*' '
-
-    text += f'{indent}- '
-    text += f'\n{indent}- '.join(description.blocks)
+    parts.append(f'\n{indent}- ')
+    parts.append(f'\n{indent}- '.join(description.blocks))
 
-    return text
+    return ''.join(parts)
 
 
 class Notification(enum.StrEnum):
@@ -54,6 +65,9 @@ class Notification(enum.StrEnum):
     REMINDER_SHORT = enum.auto()  # short time period (default 14 days)
     REMINDER_LONG = enum.auto()   # long time period  (default 1 month)
 
+    def __init__(self, *args) -> None:
+        self._store_key = f'{_SENT_NOTIFICATIONS_KEY}-{str(self)}'
+
     def notify_delta(self, actor_input: dict) -> datetime.timedelta:
         days = actor_input.get(f'days_{str(self)}')
         assert days is not None, 'Malformed Actor INPUT'
@@ -61,78 +75,175 @@ class Notification(enum.StrEnum):
         return datetime.timedelta(days=days)
 
     @property
-    def store_key(self):
-        return f'{_SENT_NOTIFICATIONS_KEY}-{str(self)}'
+    def store_key(self) -> str:
+        return self._store_key
 
 
-@acache
-async def _fetch_slack_users(slack: slack_sdk.WebClient):
-    return await asyncio.to_thread(slack.users_list)
+async def _fetch_slack_users(
+    slack: slack_sdk.WebClient,
+    store: KeyValueStore,
+) -> list[dict]:
+    """
+    the members list is persisted in the KV store, so that runs close
+    to each other do not hit the (rate limited) `users.list` again
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    cached = await store.get_value(_SLACK_USERS_CACHE_KEY)
+    if (cached is not None
+            and now - datetime.datetime.fromisoformat(cached['ts']) < _SLACK_USERS_CACHE_TTL):
+        return cached['members']
 
+    slack_users = await asyncio.to_thread(slack.users_list)
 
-async def _get_slack_id_for_email(slack: slack_sdk.WebClient, email: str) -> str | None:
-    slack_users = await _fetch_slack_users(slack)
-    members = slack_users.get('members')
+    # keep only what is needed for the lookup, not whole user profiles
+    raw_members: list[dict] = slack_users.get('members', [])
+    members = [
+        {'id': member['id'], 'profile': {'email': member.get('profile', {}).get('email')}}
+        for member in raw_members
+    ]
+    await store.set_value(
+        _SLACK_USERS_CACHE_KEY, {'ts': now.isoformat(), 'members': members})
 
-    for member in members:
+    return members
+
+
+@acache
+async def _slack_ids_by_email(
+    slack: slack_sdk.WebClient,
+    store: KeyValueStore,
+) -> dict[str, str]:
+    slack_ids: dict[str, str] = {}
+
+    for member in await _fetch_slack_users(slack, store):
         member_email = member.get('profile', {}).get('email')
 
-        if member_email == email:
-            return member['id']
+        # the first member with the e-mail wins
+        if member_email is not None:
+            slack_ids.setdefault(member_email, member['id'])
 
-    # not found
-    return None
+    return slack_ids
 
 
 async def create_notification_text(
     notification: Notification,
     slack: slack_sdk.WebClient,
+    store: KeyValueStore,
     resources: list[Expiriable],
     default_owner: str | None,
-) -> str:
-    message: str
+) -> tuple[str, list[dict]]:
+    """
+    returns the plain message (fallback `text`) and the same content as
+    Slack `markdown` blocks, one block per resource row
+    """
+    header: str
     match notification:
         case Notification.URGENT:
-            message = 'Hey!\n'
-            message += 'These AWS savings plans will be expiring very soon! You might want to renew them.\n\n'  # noqa: E501
+            header = (
+                'Hey!\n'
+                'These AWS savings plans will be expiring very soon! You might want to renew them.\n\n'  # noqa: E501
+            )
         case _:
-            message = 'Hi.\n'
-            message += 'There seem to be some savings plans in AWS that will be expiring soon. Just letting you know ;)\n\n'  # noqa: E501
+            header = (
+                'Hi.\n'
+                'There seem to be some savings plans in AWS that will be expiring soon. Just letting you know ;)\n\n'  # noqa: E501
+            )
 
-    for resource in resources:
-        owner_email = resource.owner or default_owner
-        owner = None
+    owner_emails = [resource.owner or default_owner for resource in resources]
 
-        if owner_email is not None:
-            owner = await _get_slack_id_for_email(slack, owner_email)
+    # resolve all owners up front, Slack is not asked at all when there are none
+    slack_ids: dict[str, str] = {}
+    if any(email is not None for email in owner_emails):
+        slack_ids = await _slack_ids_by_email(slack, store)
 
-        message += f'{_format_resource_row(resource, owner)}\n'  # noqa: E501
+    rows = [
+        _format_resource_row(
+            resource,
+            slack_ids.get(owner_email) if owner_email is not None else None,
+        )
+        for resource, owner_email in zip(resources, owner_emails)
+    ]
 
-    return message
+    text = ''.join([header, *(f'{row}\n' for row in rows)])
+    blocks = [{'type': 'markdown', 'text': header}]
+    blocks.extend({'type': 'markdown', 'text': row} for row in rows)
+
+    return text, blocks
 
 
 def get_expiring_soon(
         capacities: Iterable[Expiriable],
         notify_period: datetime.timedelta,
-        ignore_ids: set[str] = set(),
+        ignore_ids: AbstractSet[str] = frozenset(),
 ) -> Generator[Expiriable]:
-    for capacity in capacities:
-        now = datetime.datetime.now().astimezone()
-        valid_until = capacity.valid_until()
+    now = int(time.time())
+    threshold = now + int(notify_period.total_seconds())
 
-        if (not capacity.is_active()
-                or valid_until < now
-                or capacity.id in ignore_ids):
+    for capacity in capacities:
+        if capacity.id in ignore_ids or not capacity.is_active():
             continue
 
+        valid_until = capacity.valid_until_timestamp()
+
         #                V(now+notify_period)
         # ---|--------|--|-----
         #    ^now     ^valid_until
 
-        if valid_until <= now + notify_period:
+        if now <= valid_until <= threshold:
             yield capacity
 
 
+def partition_expiring_soon(
+        capacities: Iterable[Expiriable],
+        notify_periods: dict[Notification, datetime.timedelta],
+        ignore_ids: Mapping[Notification, AbstractSet[str]] | None = None,
+        assume_sorted: bool = False,
+) -> dict[Notification, list[Expiriable]]:
+    """
+    same as `get_expiring_soon` for every notification type, in a single pass
+
+    with `assume_sorted` the capacities have to be ordered by their expiration,
+    the scan then stops at the first one past every window
+    """
+    if ignore_ids is None:
+        ignore_ids = {}
+
+    now = int(time.time())
+    windows = [
+        (notification, now + int(period.total_seconds()),
+         ignore_ids.get(notification, frozenset()))
+        for notification, period in notify_periods.items()
+    ]
+    last_threshold = max((threshold for _, threshold, _ in windows), default=now)
+    # resources ignored by every window are dropped before any other check
+    ignored_everywhere: AbstractSet[str] = (
+        functools.reduce(operator.and_, (ignored for _, _, ignored in windows))
+        if len(windows) > 0 else frozenset()
+    )
+    to_notify: dict[Notification, list[Expiriable]] = {
+        notification: [] for notification in notify_periods
+    }
+
+    for capacity in capacities:
+        capacity_id = capacity.id
+        if capacity_id in ignored_everywhere or not capacity.is_active():
+            continue
+
+        valid_until = capacity.valid_until_timestamp()
+        if valid_until < now:
+            continue
+
+        if assume_sorted and valid_until > last_threshold:
+            break
+
+        # the windows overlap - a resource can be in more of them
+        for notification, threshold, ignored in windows:
+            if valid_until <= threshold and capacity_id not in ignored:
+                to_notify[notification].append(capacity)
+
+    return to_notify
+
+
 async def mark_resources_as_notified(
         notification_type: Notification,
         store: KeyValueStore,
@@ -141,10 +252,14 @@ async def mark_resources_as_notified(
     if notification_type is Notification.URGENT:
         return
 
-    previous_ids: set[str] = set(await store.get_value(notification_type.store_key, []))
-    previous_ids.update(r.id for r in resources)
+    previous_ids: list[str] = await store.get_value(notification_type.store_key, [])
+    new_ids = {r.id for r in resources}.difference(previous_ids)
+
+    # nothing to mark - do not rewrite the record
+    if len(new_ids) == 0:
+        return
 
-    await store.set_value(notification_type.store_key, list(previous_ids))
+    await store.set_value(notification_type.store_key, previous_ids + list(new_ids))
 
 
 async def cleanup_kv_store(
@@ -153,8 +268,12 @@ async def cleanup_kv_store(
         all_savings_plans: Iterable[Expiriable],
 ) -> None:
     savings_plans_ids = {sp.id for sp in all_savings_plans}
-    saved_keys: set[str] = set(await store.get_value(notification_type.store_key, []))
+    saved_keys: list[str] = await store.get_value(notification_type.store_key, [])
 
-    only_existing_keys = saved_keys.intersection(savings_plans_ids)
+    only_existing_keys = [key for key in saved_keys if key in savings_plans_ids]
+
+    # nothing was removed - do not rewrite the record
+    if len(only_existing_keys) == len(saved_keys):
+        return
 
-    await store.set_value(notification_type.store_key, list(only_existing_keys))
+    await store.set_value(notification_type.store_key, only_existing_keys)